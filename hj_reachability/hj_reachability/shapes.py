@@ -72,6 +72,24 @@ def upper_half_space(grid: Grid, axis, value):
     return data
 
 
+def _fold(op, shape, shapes):
+    """Folds `shape` and `shapes` together with the ufunc `op`, accumulating into a freshly allocated buffer.
+
+    Only the first application allocates; later ones write into that buffer whenever broadcasting and dtype allow,
+    so a single temporary lives at a time. Inputs, including read-only memory-mapped arrays, are never modified.
+    """
+    result, owned = shape, False
+    for shape in shapes:
+        other = shape if isinstance(shape, np.ndarray) else np.asarray(shape)
+        if (owned and np.broadcast(result, other).shape == result.shape and
+                np.result_type(result, other) == result.dtype):
+            op(result, shape, out=result)
+        else:
+            result = op(result, shape)
+            owned = isinstance(result, np.ndarray)
+    return result
+
+
 def union(shape, *shapes):
     """ Calculates the union of two shapes
 
@@ -82,10 +100,7 @@ def union(shape, *shapes):
     Returns:
         np.ndarray: the element-wise minimum of two shapes
     """
-    result = shape 
-    for shape in shapes: 
-        result = np.minimum(result, shape)
-    return result
+    return _fold(np.minimum, shape, shapes)
 
 
 def intersection(shape, *shapes):
@@ -98,10 +113,7 @@ def intersection(shape, *shapes):
     Returns:
         np.ndarray: the element-wise minimum of two shapes
     """
-    result = shape
-    for shape in shapes:
-        result = np.maximum(result, shape)
-    return result
+    return _fold(np.maximum, shape, shapes)
 
 def setminus(a, *bs):
     result = a
@@ -0,0 +1,71 @@
+import os
+import tempfile
+
+from absl.testing import absltest
+import numpy as np
+
+from hj_reachability import shapes
+
+
+class ShapesTest(absltest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+
+    def test_union_and_intersection(self):
+        a, b, c = np.random.randn(3, 4, 5)
+        a_copy, b_copy, c_copy = a.copy(), b.copy(), c.copy()
+        np.testing.assert_array_equal(shapes.union(a, b, c), np.minimum(np.minimum(a, b), c))
+        np.testing.assert_array_equal(shapes.intersection(a, b, c), np.maximum(np.maximum(a, b), c))
+        np.testing.assert_array_equal(a, a_copy)
+        np.testing.assert_array_equal(b, b_copy)
+        np.testing.assert_array_equal(c, c_copy)
+
+    def test_single_argument(self):
+        a = np.random.randn(4, 5)
+        self.assertIs(shapes.union(a), a)
+        self.assertIs(shapes.intersection(a), a)
+
+    def test_mixed_dtypes(self):
+        a, b = np.random.randn(2, 4, 5).astype(np.float32)
+        c = np.random.randn(4, 5)
+        result = shapes.union(a, b, c)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_array_equal(result, np.minimum(np.minimum(a, b), c))
+        result = shapes.intersection(c, a, b)
+        self.assertEqual(result.dtype, np.float64)
+        np.testing.assert_array_equal(result, np.maximum(np.maximum(c, a), b))
+
+    def test_broadcasting(self):
+        row = np.random.randn(5)
+        a, b = np.random.randn(2, 4, 5)
+        row_copy = row.copy()
+        result = shapes.union(row, row, a, b)
+        self.assertEqual(result.shape, (4, 5))
+        np.testing.assert_array_equal(result, np.minimum(np.minimum(row, a), b))
+        result = shapes.intersection(a, b, row)
+        self.assertEqual(result.shape, (4, 5))
+        np.testing.assert_array_equal(result, np.maximum(np.maximum(a, b), row))
+        np.testing.assert_array_equal(row, row_copy)
+
+    def test_sequence_operands(self):
+        a, b, c = np.random.randn(3, 4, 5)
+        np.testing.assert_array_equal(shapes.union(a, b, c.tolist()), np.minimum(np.minimum(a, b), c))
+        np.testing.assert_array_equal(shapes.intersection(a, b, c.tolist()), np.maximum(np.maximum(a, b), c))
+        np.testing.assert_array_equal(shapes.union([1., 2.], [0., 3.], [5., -1.]), [0., -1.])
+        np.testing.assert_array_equal(shapes.intersection(np.zeros(2), np.zeros(2), (1., 2.)), [1., 2.])
+
+    def test_read_only_memmap(self):
+        a, b, c = np.random.randn(3, 4, 5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "a.npy")
+            np.save(filename, a)
+            mapped = np.load(filename, mmap_mode="r")
+            np.testing.assert_array_equal(shapes.union(mapped, b, c), np.minimum(np.minimum(a, b), c))
+            np.testing.assert_array_equal(shapes.intersection(b, mapped, c), np.maximum(np.maximum(b, a), c))
+            np.testing.assert_array_equal(mapped, a)
+            del mapped
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -31,7 +31,7 @@ class SolverTest(absltest.TestCase):
     def test_solve(self):
         times = np.linspace(0, -0.1, 3)
         initial_values = np.linalg.norm(self.problem_definition["grid"].states[..., :2], axis=-1) - 5
-        all_values = hj.solve(**self.problem_definition, times=times, initial_values=initial_values, progress_bar=False)
+        all_values = hj.solve(**self.problem_definition, times=times, target=initial_values, progress_bar=False)
         self.assertEqual(all_values.shape, (len(times),) + initial_values.shape)
         np.testing.assert_allclose(all_values[0], initial_values)
         np.testing.assert_allclose(all_values[-1],
@@ -42,5 +42,26 @@ class SolverTest(absltest.TestCase):
                                            progress_bar=False),
                                    atol=1e-2)
         np.testing.assert_allclose(
-            all_values,
-            hj.solve(**self.problem_definition, times=times, initial_values=initial_values, progress_bar=True))
+            all_values, hj.solve(**self.problem_definition, times=times, target=initial_values, progress_bar=True))
+
+    def test_solve_with_time_varying_target_and_constraints(self):
+        times = np.linspace(0, -0.1, 3)
+        distances = np.linalg.norm(self.problem_definition["grid"].states[..., :2], axis=-1)
+        target = np.stack([distances - 5 + k for k in range(len(times))])
+        constraints = np.stack([8 - distances - k for k in range(len(times))])
+        all_values = hj.solve(**self.problem_definition,
+                              times=times,
+                              target=target,
+                              constraints=constraints,
+                              progress_bar=False)
+        self.assertEqual(all_values.shape, target.shape)
+        np.testing.assert_allclose(all_values[0], np.maximum(target[0], constraints[0]))
+        values = all_values[0]
+        for i in range(1, len(times)):
+            values = hj.step(**self.problem_definition,
+                             time=times[i - 1],
+                             values=values,
+                             target_time=times[i],
+                             progress_bar=False)
+            values = np.maximum(np.minimum(values, target[i]), constraints[i])
+            np.testing.assert_allclose(all_values[i], values, atol=1e-5)